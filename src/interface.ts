@@ -86,26 +86,32 @@ export namespace UI {
 
                 // project directory name
                 const apkFilePath = result[0].fsPath;
-                let projectDir = path.join(
+                const projectDirBase = path.join(
                     path.dirname(apkFilePath),
                     path.parse(apkFilePath).name,
                 );
-                // don't delete the existing dir if it already exists
-                while (fs.existsSync(projectDir)) {
-                    projectDir = projectDir + "1";
+                // don't delete the existing dir if it already exists,
+                // use the first free numbered one instead
+                let projectDir = projectDirBase;
+                for (let i = 1; fs.existsSync(projectDir); i++) {
+                    projectDir = projectDirBase + i;
                 }
 
                 // decode APK
                 await apktool.decodeAPK(apkFilePath, projectDir, args);
 
-                // decompile APK
+                // decompile APK & quark analysis only read the original APK,
+                // so run them concurrently once the project dir exists
+                const tasks: Promise<void>[] = [];
                 if (decompileJava) {
-                    await jadx.decompileAPK(apkFilePath, projectDir, jadxArgs);
+                    tasks.push(
+                        jadx.decompileAPK(apkFilePath, projectDir, jadxArgs),
+                    );
                 }
-                // quark analysis
                 if (quarkAnalysis) {
-                    await Quark.analyzeAPK(apkFilePath, projectDir);
+                    tasks.push(Quark.analyzeAPK(apkFilePath, projectDir));
                 }
+                await Promise.all(tasks);
 
                 // Initialize project dir as git repo
                 const initializeGit = workspace
@@ -1,5 +1,4 @@
 import * as path from "path";
-import { applyPatches, observeListr } from "apk-mitm";
 import * as vscode from "vscode";
 import { outputChannel } from "../data/constants";
 
@@ -25,6 +24,10 @@ export namespace apkMitm {
 
             const projectDir = path.dirname(apktoolYmlPath);
 
+            // apk-mitm pulls in a large dependency tree, load it on demand
+            // instead of on extension activation
+            const { applyPatches, observeListr } = await import("apk-mitm");
+
             await observeListr(applyPatches(projectDir)).forEach((line: string) =>
                 outputChannel.appendLine(line),
             );
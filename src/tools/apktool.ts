@@ -3,6 +3,7 @@ import * as path from "path";
 import * as vscode from "vscode";
 import { extensionConfigName, outputChannel } from "../data/constants";
 import { executeProcess } from "../utils/executor";
+import { getJavaJarArgs } from "../utils/java";
 import { apkSigner } from "./uber-apk-signer";
 
 export namespace apktool {
@@ -41,14 +42,12 @@ export namespace apktool {
         const apkFileName = path.basename(apkFilePath);
 
         const report = `Decoding ${apkFileName} into ${projectDir}`;
-        let args = [
-            "-jar",
-            String(apktoolPath),
+        let args = await getJavaJarArgs("apktool", String(apktoolPath), [
             "d",
             apkFilePath,
             "-o",
             projectDir,
-        ];
+        ]);
         if (apktoolArgs && apktoolArgs.length > 0) {
             args = args.concat(apktoolArgs);
         }
@@ -82,7 +81,10 @@ export namespace apktool {
         const report = `Rebuilding ${apkFileName} into ${path.basename(
             projectDir,
         )}${path.sep}dist`;
-        let args = ["-jar", String(apktoolPath), "b", projectDir];
+        let args = await getJavaJarArgs("apktool", String(apktoolPath), [
+            "b",
+            projectDir,
+        ]);
         if (apktoolArgs && apktoolArgs.length > 0) {
             args = args.concat(apktoolArgs);
         }
@@ -109,12 +111,10 @@ export namespace apktool {
             vscode.workspace.getConfiguration(extensionConfigName);
         const apktoolPath = extensionConfig.get("apktoolPath");
         const report = "Cleaning up ApkTool Framework dir";
-        const args = [
-            "-jar",
-            String(apktoolPath),
+        const args = await getJavaJarArgs("apktool", String(apktoolPath), [
             "empty-framework-dir",
             "--force",
-        ];
+        ]);
         await executeProcess({
             name: "Cleanup Apktool framework dir",
             report: report,
@@ -1,8 +1,39 @@
+import * as fs from "fs";
+import * as os from "os";
 import * as path from "path";
 import * as vscode from "vscode";
 import { extensionConfigName } from "../data/constants";
 import { executeProcess } from "../utils/executor";
 
+/**
+ * Get the number of processing threads for **Jadx** when a cgroup v2 CPU
+ * quota (containers) is set. Like Jadx's own default, it's half the CPUs,
+ * but of the quota instead of all the host CPUs.
+ * @returns number of threads, or undefined to keep Jadx's default.
+ */
+function getThreadsCount(): number | undefined {
+    if (process.platform !== "linux") {
+        return undefined;
+    }
+    const defaultCount = Math.max(1, Math.floor(os.cpus().length / 2));
+    try {
+        const [quota, period] = fs
+            .readFileSync("/sys/fs/cgroup/cpu.max", "utf-8")
+            .trim()
+            .split(" ");
+        const cpuLimit = Number(quota) / Number(period);
+        if (cpuLimit > 0) {
+            const threadsCount = Math.max(1, Math.floor(cpuLimit / 2));
+            if (threadsCount < defaultCount) {
+                return threadsCount;
+            }
+        }
+    } catch (err) {
+        // no cgroup v2 CPU controller
+    }
+    return undefined;
+}
+
 export namespace jadx {
     /**
      * Decompile the APK file to Java source using **Jadx**.
@@ -26,6 +57,10 @@ export namespace jadx {
         const apkFileName = path.basename(apkFilePath);
         const report = `Decompiling ${apkFileName} into ${apkDecompileDir}`;
         let args = ["-r", "-q", "-ds", apkDecompileDir, apkFilePath];
+        const threadsCount = getThreadsCount();
+        if (threadsCount) {
+            args = ["-j", String(threadsCount)].concat(args);
+        }
         if (jadxArgs && jadxArgs.length > 0) {
             args = jadxArgs.concat(args);
         }
@@ -7,6 +7,16 @@ import { outputChannel } from "../data/constants";
 import { quarkSummaryReportHTML } from "../utils/quark-html";
 import { executeProcess } from "../utils/executor";
 
+/**
+ * Time (ms) for which a successful Quark install check is reused.
+ */
+const quarkCheckTTL = 300000;
+
+/**
+ * Expiry time of the last successful Quark install check.
+ */
+let quarkCheckExpiry = 0;
+
 /**
  * Read and parse the JSON file of quark analysis report.
  * @param reportPath The path of the `quarkReport.json` file.
@@ -261,12 +271,17 @@ export namespace Quark {
      * @return if quark installed or not
      */
     export function checkQuarkInstalled(): boolean {
+        // spawning quark (python) is slow, reuse a recent successful check
+        if (Date.now() < quarkCheckExpiry) {
+            return true;
+        }
         const cmd = "quark";
 
         outputChannel.appendLine(`exec: ${cmd}`);
 
         try {
             child_process.execSync(cmd);
+            quarkCheckExpiry = Date.now() + quarkCheckTTL;
             return true;
         } catch (error) {
             outputChannel.appendLine(`Caught error from Quark install check`);
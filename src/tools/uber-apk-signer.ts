@@ -2,6 +2,7 @@ import * as fs from "fs";
 import * as vscode from "vscode";
 import { extensionConfigName } from "../data/constants";
 import { executeProcess } from "../utils/executor";
+import { getJavaJarArgs } from "../utils/java";
 
 export namespace apkSigner {
     /**
@@ -17,14 +18,11 @@ export namespace apkSigner {
         const keyAlias = extensionConfig.get("keyAlias");
         const keyPassword = extensionConfig.get("keyPassword");
         const report = `Signing ${apkFilePath}`;
-        const args = [
-            "-jar",
+        const args = await getJavaJarArgs(
+            "uber-apk-signer",
             String(apkSignerPath),
-            "-a",
-            apkFilePath,
-            "--allowResign",
-            "--overwrite",
-        ];
+            ["-a", apkFilePath, "--allowResign", "--overwrite"],
+        );
         if (
             keystorePath &&
             fs.existsSync(String(keystorePath)) &&
@@ -1,7 +1,9 @@
 import { URL } from "url";
 import * as https from "https";
+import { IncomingMessage } from "http";
 import * as fs from "fs";
 import * as path from "path";
+import { pipeline } from "stream/promises";
 import * as vscode from "vscode";
 import extract = require("extract-zip");
 import {
@@ -11,6 +13,16 @@ import {
 } from "../data/constants";
 import { Tool } from "./updater";
 
+/**
+ * Keep-alive agent shared by all downloads to reuse TLS connections.
+ */
+const httpsAgent = new https.Agent({ keepAlive: true });
+
+/**
+ * Minimum interval (ms) between two download progress updates.
+ */
+const progressInterval = 500;
+
 /**
  * Downloads and saves a Tool in apklabDataDir.
  * @param tool a Tool object.
@@ -22,9 +34,8 @@ export async function downloadTool(tool: Tool): Promise<string | null> {
         outputChannel.appendLine("-".repeat(50));
         outputChannel.appendLine(`Downloading file: ${tool.fileName}`);
         outputChannel.appendLine("-".repeat(50));
-        const buffer = await downloadFile(tool.downloadUrl);
         const filePath = path.join(apklabDataDir, tool.fileName);
-        fs.writeFileSync(filePath, buffer);
+        await saveFile(tool.downloadUrl, filePath);
         let configPath = filePath;
         if (tool.zipped && tool.unzipDir) {
             configPath = path.join(apklabDataDir, tool.unzipDir);
@@ -59,61 +70,69 @@ export async function downloadTool(tool: Tool): Promise<string | null> {
  * @returns a Buffer of the file contents.
  */
 export async function downloadFile(urlString: string): Promise<Buffer> {
-    const buffers: any[] = [];
+    const response = await getResponse(urlString);
+    const buffers: Buffer[] = [];
 
     return new Promise<Buffer>((resolve, reject) => {
-        const request = https.request(new URL(urlString), (response) => {
-            if (
-                (response.statusCode === 301 || response.statusCode === 302) &&
-                response.headers.location
-            ) {
-                // Redirect - download from new location
-                return resolve(downloadFile(response.headers.location));
-            } else if (response.statusCode !== 200) {
-                // Download failed - print error message
-                outputChannel.appendLine(
-                    "Download failed with response code: " +
-                        response.statusCode,
-                );
-                reject("Failed");
-            }
-
-            // Downloading - hook up events
-            const contentLength = response.headers["content-length"]
-                ? response.headers["content-length"]
-                : "0";
-            const packageSize = parseInt(contentLength, 10);
-            let downloadedBytes = 0;
-            let downloadPercentage = 0;
-
-            outputChannel.appendLine(
-                `Download size: ${(packageSize / 1024 / 1024).toFixed(2)} MB`,
-            );
+        trackProgress(response);
+        response.on("data", (data) => buffers.push(data));
+        response.on("end", () => resolve(Buffer.concat(buffers)));
+        response.on("error", (err) => reject(err.message));
+    });
+}
 
-            response.on("data", (data) => {
-                downloadedBytes += data.length;
-                buffers.push(data);
+/**
+ * Download file from a given URL and stream it directly to the disk.
+ * @param urlString download URL for the file.
+ * @param filePath path to save the file at.
+ */
+export async function saveFile(
+    urlString: string,
+    filePath: string,
+): Promise<void> {
+    const response = await getResponse(urlString);
+    trackProgress(response);
+    try {
+        await pipeline(response, fs.createWriteStream(filePath));
+    } catch (err: any) {
+        // don't leave a truncated file behind
+        fs.rmSync(filePath, { force: true });
+        throw err.message;
+    }
+}
 
-                // Update status bar item with percentage
-                const newPercentage = Math.ceil(
-                    100 * (downloadedBytes / packageSize),
-                );
-                if (newPercentage !== downloadPercentage) {
-                    downloadPercentage = newPercentage;
+/**
+ * Send a GET request to a given URL and follow the redirects.
+ * @param urlString URL to request.
+ * @returns the successful (200) response.
+ */
+function getResponse(urlString: string): Promise<IncomingMessage> {
+    return new Promise<IncomingMessage>((resolve, reject) => {
+        const request = https.request(
+            new URL(urlString),
+            { agent: httpsAgent },
+            (response) => {
+                if (
+                    (response.statusCode === 301 ||
+                        response.statusCode === 302) &&
+                    response.headers.location
+                ) {
+                    // Redirect - drain the response so that the socket can
+                    // be reused and request the new location
+                    response.resume();
+                    return resolve(getResponse(response.headers.location));
+                } else if (response.statusCode !== 200) {
+                    // Download failed - print error message
                     outputChannel.appendLine(
-                        `Downloaded ${downloadPercentage}%`,
+                        "Download failed with response code: " +
+                            response.statusCode,
                     );
+                    response.resume();
+                    return reject("Failed");
                 }
-            });
-
-            response.on("end", () => {
-                resolve(Buffer.concat(buffers));
-            });
-
-            response.on("error", (err) => {
-                reject(err.message);
-            });
-        });
+                resolve(response);
+            },
+        );
 
         request.on("error", (err) => {
             reject(err.message);
@@ -123,3 +142,44 @@ export async function downloadFile(urlString: string): Promise<Buffer> {
         request.end();
     });
 }
+
+/**
+ * Log the download progress of a response to the output channel.
+ * @param response the response being downloaded.
+ */
+function trackProgress(response: IncomingMessage): void {
+    const contentLength = response.headers["content-length"]
+        ? response.headers["content-length"]
+        : "0";
+    const packageSize = parseInt(contentLength, 10);
+    let downloadedBytes = 0;
+    let downloadPercentage = 0;
+    let lastProgressTime = Date.now();
+
+    if (packageSize > 0) {
+        const sizeMB = (packageSize / 1024 / 1024).toFixed(2);
+        outputChannel.appendLine(`Download size: ${sizeMB} MB`);
+    }
+
+    response.on("data", (data) => {
+        downloadedBytes += data.length;
+
+        // Update percentage at most once per progressInterval
+        const now = Date.now();
+        if (packageSize > 0 && now - lastProgressTime >= progressInterval) {
+            lastProgressTime = now;
+            const newPercentage = Math.floor(
+                100 * (downloadedBytes / packageSize),
+            );
+            if (newPercentage !== downloadPercentage) {
+                downloadPercentage = newPercentage;
+                outputChannel.appendLine(`Downloaded ${downloadPercentage}%`);
+            }
+        }
+    });
+
+    response.on("end", () => {
+        const sizeMB = (downloadedBytes / 1024 / 1024).toFixed(2);
+        outputChannel.appendLine(`Downloaded ${sizeMB} MB`);
+    });
+}
@@ -1,5 +1,6 @@
 import * as child_process from "child_process";
 import * as fs from "fs";
+import { StringDecoder } from "string_decoder";
 import * as vscode from "vscode";
 import { outputChannel } from "../data/constants";
 
@@ -37,6 +38,27 @@ type ProcessOptions = {
     shell?: boolean;
 };
 
+/**
+ * Max length of a partial output line kept back until its line break.
+ */
+const maxPendingOutput = 64 * 1024;
+
+/**
+ * Split process output into lines, `\r` (progress bar redraws) included.
+ * @param text output text ending at a line break.
+ * @returns the `\n` separated lines, split again at (repeated) `\r`.
+ */
+function splitOutputLines(text: string): string[] {
+    return text
+        .replace(/\r?\n$/, "")
+        .split(/\r\n|\n/)
+        .flatMap((line) =>
+            line.includes("\r")
+                ? line.split("\r").filter((part) => part.length > 0)
+                : [line],
+        );
+}
+
 /**
  * Executes a child_process and calls a callback if provided.
  * @param processOptions Takes a ProcessOptions type to process.
@@ -67,20 +89,66 @@ export function executeProcess(processOptions: ProcessOptions): Thenable<void> {
                         shell: processOptions.shell,
                     },
                 );
-                cp.stdout.on("data", (data) =>
-                    outputChannel.appendLine(data.toString().trim()),
-                );
-                cp.stderr.on("data", (data) =>
-                    outputChannel.appendLine(data.toString().trim()),
-                );
+                // decode stdout & stderr separately and print only complete
+                // lines in batches, short partial lines wait for the next chunk
+                const stdout = { decoder: new StringDecoder("utf8"), text: "" };
+                const stderr = { decoder: new StringDecoder("utf8"), text: "" };
+                const linePrefix = `[${processOptions.name}] `;
+                let flushTimer: NodeJS.Timeout | undefined;
+                const flushOutput = (final = false) => {
+                    clearTimeout(flushTimer);
+                    flushTimer = undefined;
+                    [stdout, stderr].forEach((output) => {
+                        if (final) {
+                            output.text += output.decoder.end();
+                        }
+                        let end = output.text.length;
+                        if (!final && end <= maxPendingOutput) {
+                            // a trailing "\r" may be the start of "\r\n"
+                            const lastLF = output.text.lastIndexOf("\n");
+                            const lastCR =
+                                end > 1
+                                    ? output.text.lastIndexOf("\r", end - 2)
+                                    : -1;
+                            end = Math.max(lastLF, lastCR) + 1;
+                        }
+                        if (end > 0) {
+                            const lines = output.text.slice(0, end);
+                            output.text = output.text.slice(end);
+                            // prefix the lines with the process name, as
+                            // processes can run (and print) concurrently
+                            outputChannel.append(
+                                splitOutputLines(lines)
+                                    .map((line) => `${linePrefix}${line}\n`)
+                                    .join(""),
+                            );
+                        }
+                    });
+                };
+                const onOutput = (output: typeof stdout) => (data: Buffer) => {
+                    output.text += output.decoder.write(data);
+                    if (!flushTimer) {
+                        flushTimer = setTimeout(flushOutput, 100);
+                    }
+                };
+                cp.stdout.on("data", onOutput(stdout));
+                cp.stderr.on("data", onOutput(stderr));
+                // a failed spawn (e.g. ENOENT) emits "close" after "error"
+                let failedToSpawn = false;
                 cp.on("error", (data) => {
+                    failedToSpawn = true;
+                    flushOutput(true);
                     outputChannel.appendLine(data.toString().trim());
                     vscode.window.showErrorMessage(
                         `APKLab: ${processOptions.name} process failed.`,
                     );
                     resolve();
                 });
-                cp.on("exit", async (code) => {
+                cp.on("close", async (code) => {
+                    if (failedToSpawn) {
+                        return;
+                    }
+                    flushOutput(true);
                     if (
                         code === 0 &&
                         (processOptions.shouldExist
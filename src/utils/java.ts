@@ -0,0 +1,75 @@
+import * as child_process from "child_process";
+import * as path from "path";
+import { apklabDataDir } from "../data/constants";
+
+/**
+ * JVM options for short-lived `java -jar` tools (Apktool, uber-apk-signer).
+ */
+const jvmOptions = [
+    // throughput collector: fewer but longer GC pauses, fine for batch jobs
+    "-XX:+UseParallelGC",
+];
+
+/**
+ * Major version of the `java` command, detected once per session.
+ */
+let javaMajorVersion: Promise<number> | undefined;
+
+/**
+ * Get the major version of the `java` command, e.g. `8` for `1.8.0_392`.
+ * @returns the major version, or 0 if it couldn't be detected.
+ */
+function getJavaMajorVersion(): Promise<number> {
+    if (!javaMajorVersion) {
+        javaMajorVersion = new Promise<number>((resolve) => {
+            child_process.execFile(
+                "java",
+                ["-version"],
+                (_error, _stdout, stderr) => {
+                    const match = /version "(\d+)(?:\.(\d+))?/.exec(stderr);
+                    let version = 0;
+                    if (match) {
+                        version = Number(match[1]);
+                        if (version === 1 && match[2]) {
+                            version = Number(match[2]);
+                        }
+                    }
+                    if (version === 0) {
+                        // retry next time, java may get installed meanwhile
+                        javaMajorVersion = undefined;
+                    }
+                    resolve(version);
+                },
+            );
+        });
+    }
+    return javaMajorVersion;
+}
+
+/**
+ * Build the `java` CLI args to run a jar with tuned JVM options.
+ * On JDK 19+ each tool also gets its own class data sharing archive in
+ * apklabDataDir, so repeated runs skip loading & verifying the same classes.
+ * The archive is rebuilt automatically when the jar changes (tool update).
+ * @param toolName name of the tool, used for the archive name.
+ * @param jarPath path of the jar file.
+ * @param args CLI args passed to the jar.
+ * @returns args for the `java` command.
+ */
+export async function getJavaJarArgs(
+    toolName: string,
+    jarPath: string,
+    args: string[],
+): Promise<string[]> {
+    const javaArgs = [...jvmOptions];
+    // older JVMs take a missing archive as the base archive and disable
+    // class data sharing altogether, only JDK 19+ can create it on exit
+    if ((await getJavaMajorVersion()) >= 19) {
+        const archivePath = path.join(apklabDataDir, `${toolName}.jsa`);
+        javaArgs.push(
+            "-XX:+AutoCreateSharedArchive",
+            `-XX:SharedArchiveFile=${archivePath}`,
+        );
+    }
+    return [...javaArgs, "-jar", jarPath, ...args];
+}
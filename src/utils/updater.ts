@@ -49,6 +49,11 @@ export type Tool = {
  */
 type Config = { tools: Tool[] };
 
+/**
+ * Parsed local `config.json` with its mtime, re-read only when it changes.
+ */
+let cachedConfig: { mtimeMs: number; config: Config } | undefined;
+
 /**
  * Check the tools in update config
  * If any tool does not exist or does not match given file name, download it.
@@ -145,11 +150,18 @@ export function checkAndInstallTools(): Promise<void> {
  */
 async function getUpdateConfig(): Promise<Config> {
     const configFile = path.resolve(apklabDataDir, "config.json");
-    let configJsonData = { tools: [] };
+    let configJsonData: Config = { tools: [] };
 
     if (fs.existsSync(configFile)) {
-        configJsonData = JSON.parse(fs.readFileSync(configFile, "utf-8"));
-        if (Date.now() - fs.statSync(configFile).mtimeMs < 86400000) {
+        const mtimeMs = fs.statSync(configFile).mtimeMs;
+        if (!cachedConfig || cachedConfig.mtimeMs !== mtimeMs) {
+            cachedConfig = {
+                mtimeMs: mtimeMs,
+                config: JSON.parse(fs.readFileSync(configFile, "utf-8")),
+            };
+        }
+        configJsonData = cachedConfig.config;
+        if (Date.now() - mtimeMs < 86400000) {
             return configJsonData;
         }
     }